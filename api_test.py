@@ -3,9 +3,9 @@ import requests
 import json
 
 # Load a sample from your preprocessed data
-df = pd.read_csv('D:/Battery_Failure_Prediction/nasa_battery_data_preprocessed.csv')
 features = ['cycle', 'voltage', 'current', 'temperature', 'capacity', 'time', 'internal_resistance']
-sample_data = df[features].values[:25]  # First 25 rows
+df = pd.read_csv('D:/Battery_Failure_Prediction/nasa_battery_data_preprocessed.csv', usecols=features, nrows=25)
+sample_data = df[features].values  # First 25 rows
 
 url = "http://localhost:5000/predict"
 data = {"data": sample_data.tolist()}
@@ -18,8 +18,8 @@ app = Flask(__name__)
 
 # Load preprocessed data for scaler fitting
 try:
-    df = pd.read_csv('D:/Battery_Failure_Prediction/nasa_battery_data_preprocessed.csv')
     features = ['cycle', 'voltage', 'current', 'temperature', 'capacity', 'time', 'internal_resistance']
+    df = pd.read_csv('D:/Battery_Failure_Prediction/nasa_battery_data_preprocessed.csv', usecols=features)
     X = df[features].values
     scaler = MinMaxScaler()
     scaler.fit(X)
@@ -1,38 +1,120 @@
 import streamlit as st
 import pandas as pd
 import requests
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
+import os
+import re
+import tempfile
+import importlib.util
+import logging
 from datetime import datetime
 
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Use pyarrow's multithreaded CSV parser and Parquet support when it is installed;
+# only look it up here, pandas imports it on first use
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+
 # Streamlit app configuration
 st.set_page_config(page_title="Battery Failure Prediction Dashboard", layout="wide")
 
-# Title and description
-st.title("🔋 Battery Failure Prediction Dashboard")
-st.markdown("""
+DATA_PATH = 'D:/Battery_Failure_Prediction/nasa_battery_data_preprocessed.csv'
+
+# Static page text
+INTRO_MD = """
 This dashboard provides real-time battery failure predictions using an ensemble model (XGBoost, One-Class SVM, LSTM). 
 Select a battery ID and cycle range to predict failure probabilities and visualize trends.
-""")
+"""
+
+# Title and description
+st.title("🔋 Battery Failure Prediction Dashboard")
+st.markdown(INTRO_MD)
 
-# Load preprocessed data for reference
-@st.cache_data
-def load_data():
+# Cheap cache key for a data file: changes whenever the file is replaced or rewritten
+def file_signature(path):
     try:
-        df = pd.read_csv('D:/Battery_Failure_Prediction/nasa_battery_data_preprocessed.csv')
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+# Parquet copy of a CSV, named after the CSV signature it was built from
+def parquet_copy_path(path, signature):
+    mtime_ns, size = signature
+    return f"{os.path.splitext(path)[0]}.{mtime_ns}-{size}.parquet"
+
+# Remove Parquet copies built from older versions of a CSV; only names parquet_copy_path produces are touched
+def remove_stale_parquet_copies(path, keep):
+    directory, name = os.path.split(os.path.splitext(path)[0])
+    copy_name = re.compile(re.escape(name) + r'\.\d+-\d+\.parquet')
+    for entry in os.listdir(directory or '.'):
+        if copy_name.fullmatch(entry) and entry != os.path.basename(keep):
+            try:
+                os.remove(os.path.join(directory, entry))
+            except OSError:
+                pass
+
+# Load preprocessed data for reference; only the path and the small signature tuple are hashed
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_data(path, signature):
+    try:
+        # Only reuse a Parquet copy built from exactly this version of the CSV
+        parquet_path = parquet_copy_path(path, signature) if HAS_PYARROW and signature is not None else None
+        if parquet_path and os.path.exists(parquet_path):
+            try:
+                df = pd.read_parquet(parquet_path, engine='pyarrow')
+                # Parquet only keeps string columns as categorical, so the integer ids come back as int64
+                df['battery_id'] = df['battery_id'].astype('category')
+                return df
+            except Exception as e:
+                # An unreadable copy is rebuilt below from the CSV, which is still valid
+                logger.warning(f"Could not read Parquet copy {parquet_path}: {e}")
+        # Narrow the id/label columns; feature columns stay float64 since they are sent to the model as-is
+        df = pd.read_csv(path, engine=CSV_ENGINE, dtype={'cycle': 'int16', 'failure': 'int8'})
+        # Convert after parsing so the categories keep the ids' numeric type and sort order
+        df['battery_id'] = df['battery_id'].astype('category')
+        if parquet_path:
+            # Write to a uniquely named temp file first so a failed write never leaves a truncated
+            # Parquet copy behind and concurrent sessions never write to the same file
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(parquet_path) or '.', suffix='.parquet.tmp')
+                os.close(fd)
+                df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', row_group_size=100_000)
+                os.replace(tmp_path, parquet_path)
+                remove_stale_parquet_copies(path, keep=parquet_path)
+            except Exception as e:
+                # The CSV already loaded fine; skip the Parquet copy this time
+                logger.warning(f"Could not write Parquet copy {parquet_path}: {e}")
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
         return df
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
-df = load_data()
+# Sidebar options derived from the dataset, keyed on the same file signature as the data
+@st.cache_data(show_spinner=False)
+def _data_summary(path, signature):
+    df = load_data(path, signature)
+    # Categories are already the sorted distinct ids, so no scan of the column is needed
+    return df['battery_id'].cat.categories.tolist(), int(df['cycle'].min()), int(df['cycle'].max())
+
+data_signature = file_signature(DATA_PATH)
+df = load_data(DATA_PATH, data_signature)
 
 if df is not None:
+    battery_ids, cycle_min, cycle_max = _data_summary(DATA_PATH, data_signature)
+
     # Sidebar for user inputs
     st.sidebar.header("Prediction Settings")
-    battery_id = st.sidebar.selectbox("Select Battery ID", sorted(df['battery_id'].unique()), index=0)
-    cycle_range = st.sidebar.slider("Select Cycle Range", min_value=int(df['cycle'].min()), max_value=int(df['cycle'].max()), value=(2, 248))
+    battery_id = st.sidebar.selectbox("Select Battery ID", battery_ids, index=0)
+    cycle_range = st.sidebar.slider("Select Cycle Range", min_value=cycle_min, max_value=cycle_max, value=(2, 248))
 
     # Filter data based on user selection
     filtered_df = df[(df['battery_id'] == battery_id) & (df['cycle'].between(cycle_range[0], cycle_range[1]))]
@@ -66,6 +148,9 @@ if df is not None:
 
             # Visualize failure probability over cycles
             st.subheader("Failure Probability Trend")
+            # Plotting libraries are only needed once predictions come back, so import them here
+            import matplotlib.pyplot as plt
+            import seaborn as sns
             fig, ax = plt.subplots(figsize=(10, 6))
             sns.lineplot(data=pred_df, x='cycle', y='ensemble_prob', marker='o', ax=ax)
             ax.set_title(f"Failure Probability Over Cycles (Battery ID: {battery_id})")
@@ -79,10 +164,12 @@ if df is not None:
             avg_prob = pred_df['ensemble_prob'].mean()
             max_prob = pred_df['ensemble_prob'].max()
             failure_count = pred_df['predicted_failure'].sum()
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Average Failure Probability", f"{avg_prob:.2f}")
-            col2.metric("Max Failure Probability", f"{max_prob:.2f}")
-            col3.metric("Predicted Failures", f"{failure_count}/{len(pred_df)}")
+            # Rendered as one table rather than three separate metric elements
+            stats_df = pd.DataFrame({
+                'Metric': ["Average Failure Probability", "Max Failure Probability", "Predicted Failures"],
+                'Value': [f"{avg_prob:.2f}", f"{max_prob:.2f}", f"{failure_count}/{len(pred_df)}"]
+            })
+            st.dataframe(stats_df, hide_index=True)
 
         else:
             st.warning("No predictions received. Please check the API connection and try again.")
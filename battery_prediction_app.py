@@ -1,5 +1,4 @@
 import streamlit as st
-import numpy as np
 
 st.title("🔋 Battery Cycle Life Estimator")
 
@@ -31,6 +31,18 @@ XGB_JSON_PATH = os.path.join(MODEL_DIR, "xgboost_model_tuned.json")    # Fallbac
 SVM_MODEL_PATH = os.path.join(MODEL_DIR, "one_class_svm_model_tuned.joblib")
 LSTM_MODEL_PATH = os.path.join(MODEL_DIR, "lstm_model_tuned.h5")
 
+# Static page text
+INTRO_MD = """
+This app checks your battery’s health and predicts potential failures. Enter details like the battery’s capacity (mAh), voltage, and how often you charge it, or upload a CSV for multiple batteries.
+"""
+INSTRUCTIONS_MD = """
+### Instructions
+- **Enter Details**: Provide the battery’s capacity (mAh), voltage, age (months), and charge frequency (e.g., 3 times per week). Leave optional fields as default if unknown.
+- **Upload CSV**: Use a CSV with columns: capacity_mah, voltage, battery_age_months, charge_frequency, temperature. Optional: current, time, internal_resistance.
+- **Output**: View the battery’s health (SOH), failure risk, and estimated remaining cycles. Download the report as a CSV.
+- **Troubleshooting**: Ensure all model files and scaler.joblib are in the models/ directory. Check Streamlit Cloud logs (Manage app > Logs) for errors.
+"""
+
 # Check if model and scaler files exist
 for path in [SCALER_PATH, SVM_MODEL_PATH, LSTM_MODEL_PATH]:
     if not os.path.exists(path):
@@ -45,8 +57,9 @@ if not os.path.exists(xgb_path):
     logger.error(f"XGBoost model not found")
     st.stop()
 
-# Load models and scaler
-try:
+# Load models and scaler once per process; later reruns reuse the cached objects
+@st.cache_resource(show_spinner="Loading models...")
+def load_models(xgb_path):
     scaler = joblib.load(SCALER_PATH)
     svm_model = joblib.load(SVM_MODEL_PATH)
     lstm_model = keras.models.load_model(LSTM_MODEL_PATH)
@@ -57,6 +70,10 @@ try:
     else:
         xgb_model = joblib.load(xgb_path)
     logger.info("Models and scaler loaded successfully.")
+    return scaler, svm_model, lstm_model, xgb_model
+
+try:
+    scaler, svm_model, lstm_model, xgb_model = load_models(xgb_path)
 except Exception as e:
     st.error(f"Error loading models or scaler: {str(e)}")
     logger.error(f"Error loading models or scaler: {str(e)}")
@@ -67,9 +84,7 @@ os.makedirs(PREDICTIONS_DIR, exist_ok=True)
 
 # Streamlit app
 st.title("Battery Life Predictor")
-st.markdown("""
-This app checks your battery’s health and predicts potential failures. Enter details like the battery’s capacity (mAh), voltage, and how often you charge it, or upload a CSV for multiple batteries.
-""")
+st.markdown(INTRO_MD)
 
 # Sidebar for input selection
 st.sidebar.header("Choose Input Method")
@@ -112,6 +127,11 @@ def preprocess_input(data, scaler, is_manual=False):
         logger.error(f"Error preprocessing data: {str(e)}")
         return None, None
 
+# Function to save an already-serialized report to disk
+def save_report(data, path):
+    with open(path, 'wb') as f:
+        f.write(data)
+
 # Function to create LSTM sequences
 def create_lstm_sequences(data, sequence_length):
     try:
@@ -124,8 +144,9 @@ def create_lstm_sequences(data, sequence_length):
         logger.error(f"Error creating LSTM sequences: {str(e)}")
         return None
 
-# Manual input form
-if input_method == "Enter Details":
+# Manual input form; runs as a fragment so its widgets only rerun this section
+@st.fragment
+def manual_input_section():
     st.header("Enter Battery Details")
     with st.form("manual_input_form"):
         st.markdown("**Provide the following details about your battery:**")
@@ -280,10 +301,11 @@ if input_method == "Enter Details":
                     'ensemble_prob': [ensemble_prob],
                     'soh': [input_df['soh'].iloc[0]]
                 })
-                result_df.to_csv(os.path.join(PREDICTIONS_DIR, "manual_prediction.csv"), index=False)
+                report_csv = result_df.to_csv(index=False).encode('utf-8')
+                save_report(report_csv, os.path.join(PREDICTIONS_DIR, "manual_prediction.csv"))
                 st.download_button(
                     label="Download Report",
-                    data=result_df.to_csv(index=False).encode('utf-8'),
+                    data=report_csv,
                     file_name="battery_health_report.csv",
                     mime="text/csv"
                 )
@@ -291,16 +313,19 @@ if input_method == "Enter Details":
                 st.error(f"Error saving prediction: {str(e)}")
                 logger.error(f"Error saving prediction: {str(e)}")
 
-# File upload
-else:
+# File upload; runs as a fragment so uploads and downloads only rerun this section
+@st.fragment
+def csv_upload_section():
     st.header("Upload Battery Data (CSV)")
     st.markdown("Upload a CSV with columns: capacity_mah, voltage, battery_age_months, charge_frequency, temperature. Optional: current, time, internal_resistance.")
     uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
     
     if uploaded_file:
         try:
-            df = pd.read_csv(uploaded_file)
             required_columns = ['capacity_mah', 'voltage', 'battery_age_months', 'charge_frequency', 'temperature']
+            # Only parse the columns the pipeline reads; anything else in the upload is skipped
+            used_columns = set(features + required_columns + ['battery_id', 'failure', 'soc', 'soh'])
+            df = pd.read_csv(uploaded_file, usecols=lambda col: col in used_columns)
             if not all(col in df.columns for col in required_columns):
                 st.error(f"CSV must contain columns: {', '.join(required_columns)}")
             else:
@@ -321,14 +346,13 @@ else:
                 svm_pred = np.where(svm_pred == -1, 1, 0)
                 svm_prob = np.where(svm_pred == 1, 0.9, 0.1)
                 
-                # LSTM predictions
-                lstm_prob = []
-                for i in range(len(scaled_data) - sequence_length + 1):
-                    seq = create_lstm_sequences(scaled_data[i:i+sequence_length], sequence_length)
-                    if seq is None:
-                        st.stop()
-                    lstm_prob.append(lstm_model.predict(seq, verbose=0)[0][0])
-                lstm_prob = np.array(lstm_prob)
+                # LSTM predictions: score every sliding window in a single batched call
+                n_windows = len(scaled_data) - sequence_length + 1
+                if n_windows > 0:
+                    windows = np.lib.stride_tricks.sliding_window_view(scaled_data, sequence_length, axis=0).transpose(0, 2, 1)
+                    lstm_prob = lstm_model.predict(windows, verbose=0)[:, 0]
+                else:
+                    lstm_prob = np.array([])
                 lstm_pred = (lstm_prob >= 0.2).astype(int)
                 
                 # Pad LSTM predictions
@@ -342,8 +366,8 @@ else:
                 # Results DataFrame
                 result_df = pd.DataFrame({
                     'estimated_cycles': input_df['cycle'],
-                    'battery_id': df.get('battery_id', ['Unknown'] * len(df)),
-                    'actual_failure': df.get('failure', [None] * len(df)),
+                    'battery_id': df['battery_id'] if 'battery_id' in df.columns else 'Unknown',
+                    'actual_failure': df['failure'] if 'failure' in df.columns else None,
                     'ensemble_predicted_failure': ensemble_pred,
                     'ensemble_prob': ensemble_prob,
                     'soh': input_df['soh']
@@ -371,13 +395,14 @@ else:
                 
                 # Download results
                 try:
+                    report_csv = result_df.to_csv(index=False).encode('utf-8')
                     st.download_button(
                         label="Download Report",
-                        data=result_df.to_csv(index=False).encode('utf-8'),
+                        data=report_csv,
                         file_name="battery_health_report.csv",
                         mime="text/csv"
                     )
-                    result_df.to_csv(os.path.join(PREDICTIONS_DIR, "uploaded_predictions.csv"), index=False)
+                    save_report(report_csv, os.path.join(PREDICTIONS_DIR, "uploaded_predictions.csv"))
                 except Exception as e:
                     st.error(f"Error saving CSV: {str(e)}")
                     logger.error(f"Error saving CSV: {str(e)}")
@@ -385,11 +410,11 @@ else:
             st.error(f"Error processing CSV: {str(e)}")
             logger.error(f"Error processing CSV: {str(e)}")
 
+# Render the selected input section
+if input_method == "Enter Details":
+    manual_input_section()
+else:
+    csv_upload_section()
+
 # Instructions
-st.markdown("""
-### Instructions
-- **Enter Details**: Provide the battery’s capacity (mAh), voltage, age (months), and charge frequency (e.g., 3 times per week). Leave optional fields as default if unknown.
-- **Upload CSV**: Use a CSV with columns: capacity_mah, voltage, battery_age_months, charge_frequency, temperature. Optional: current, time, internal_resistance.
-- **Output**: View the battery’s health (SOH), failure risk, and estimated remaining cycles. Download the report as a CSV.
-- **Troubleshooting**: Ensure all model files and scaler.joblib are in the models/ directory. Check Streamlit Cloud logs (Manage app > Logs) for errors.
-""")
\ No newline at end of file
+st.markdown(INSTRUCTIONS_MD)
\ No newline at end of file